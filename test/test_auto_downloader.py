@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+# Allow direct execution
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import collections
+import json
+import shutil
+import tempfile
+import types
+
+# Keep the script from trying to pip-install pyperclip on import
+sys.modules.setdefault('pyperclip', types.ModuleType('pyperclip'))
+
+if sys.version_info >= (3, 6):
+    import youtube_auto_downloader
+else:
+    youtube_auto_downloader = None
+
+
+@unittest.skipIf(youtube_auto_downloader is None, 'needs Python 3.6+')
+class TestAutoDownloader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        config_path = os.path.join(cls.tmp_dir, 'config.json')
+        with open(config_path, 'w') as f:
+            json.dump({
+                'download_path': os.path.join(cls.tmp_dir, 'downloads'),
+                'enable_notifications': False,
+                'max_concurrent': 1,
+            }, f)
+        cls.downloader = youtube_auto_downloader.YouTubeAutoDownloader(config_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.downloader.shutdown()
+        shutil.rmtree(cls.tmp_dir)
+
+    def test_is_youtube_url(self):
+        is_youtube_url = self.downloader.is_youtube_url
+        self.assertIsNone(is_youtube_url(''))
+        self.assertIsNone(is_youtube_url('just some text'))
+        self.assertIsNone(is_youtube_url('https://vimeo.com/watch?v=dQw4w9WgXcQ'))
+
+        # Fast path returns canonical URLs
+        self.assertEqual(
+            is_youtube_url('see https://youtu.be/dQw4w9WgXcQ here'),
+            'https://youtu.be/dQw4w9WgXcQ')
+        self.assertEqual(
+            is_youtube_url('https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLabc&t=10'),
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ')
+        self.assertEqual(
+            is_youtube_url('youtube.com/watch?v=dQw4w9WgXcQ'),
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ')
+
+        # Ids that are not exactly 11 characters fall through to the regex
+        self.assertEqual(
+            is_youtube_url('https://youtu.be/dQw4w9WgXc'),
+            'https://youtu.be/dQw4w9WgXc')
+        self.assertEqual(
+            is_youtube_url('https://youtu.be/dQw4w9WgXcQQ'),
+            'https://youtu.be/dQw4w9WgXcQQ')
+
+        # Shorts, playlists and other spellings use the regex
+        self.assertEqual(
+            is_youtube_url('https://www.youtube.com/shorts/dQw4w9WgXcQ'),
+            'https://www.youtube.com/shorts/dQw4w9WgXcQ')
+        self.assertEqual(
+            is_youtube_url('youtube.com/playlist?list=PLabc_-1'),
+            'https://youtube.com/playlist?list=PLabc_-1')
+        self.assertEqual(
+            is_youtube_url('HTTPS://WWW.YOUTUBE.COM/WATCH?V=dQw4w9WgXcQ'),
+            'HTTPS://WWW.YOUTUBE.COM/WATCH?V=dQw4w9WgXcQ')
+
+    def test_extract_ids(self):
+        extract_ids = self.downloader._extract_ids
+        self.assertEqual(
+            extract_ids('https://youtu.be/dQw4w9WgXcQ'), ('dQw4w9WgXcQ', None))
+        self.assertEqual(
+            extract_ids('https://youtu.be/dQw4w9WgXcQ?list=PLabc'), ('dQw4w9WgXcQ', 'PLabc'))
+        self.assertEqual(
+            extract_ids('https://www.youtube.com/watch?v=dQw4w9WgXcQ'), ('dQw4w9WgXcQ', None))
+        self.assertEqual(
+            extract_ids('https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLabc'),
+            ('dQw4w9WgXcQ', 'PLabc'))
+        self.assertEqual(
+            extract_ids('https://www.youtube.com/shorts/dQw4w9WgXcQ'), ('dQw4w9WgXcQ', None))
+        self.assertEqual(
+            extract_ids('https://youtube.com/playlist?list=PLabc'), (None, 'PLabc'))
+        self.assertEqual(extract_ids('https://www.youtube.com/'), (None, None))
+
+        # Detection is case-insensitive, so id extraction must be too
+        self.assertEqual(
+            extract_ids('HTTPS://YOUTUBE.COM/WATCH?V=dQw4w9WgXcQ'), ('dQw4w9WgXcQ', None))
+        self.assertEqual(
+            extract_ids('HTTPS://WWW.YOUTUBE.COM/SHORTS/dQw4w9WgXcQ'), ('dQw4w9WgXcQ', None))
+        self.assertEqual(
+            extract_ids('HTTPS://YOUTUBE.COM/PLAYLIST?LIST=PLabc'), (None, 'PLabc'))
+        self.assertEqual(
+            extract_ids('HTTPS://YOUTU.BE/dQw4w9WgXcQ'), ('dQw4w9WgXcQ', None))
+
+    def test_remember_id(self):
+        max_seen_ids = youtube_auto_downloader.MAX_SEEN_IDS
+        youtube_auto_downloader.MAX_SEEN_IDS = 3
+        try:
+            ids = collections.OrderedDict()
+            for video_id in ('a', 'b', 'c', 'a', 'd'):
+                youtube_auto_downloader._remember_id(ids, video_id)
+            # 'a' was refreshed, so 'b' is the oldest and gets evicted
+            self.assertEqual(list(ids), ['c', 'a', 'd'])
+        finally:
+            youtube_auto_downloader.MAX_SEEN_IDS = max_seen_ids
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,10 +11,12 @@ import sys
 import time
 import json
 import re
+import string
+import urllib.parse
 import logging
+import logging.handlers
 import threading
-from queue import Queue
-from datetime import datetime
+import collections
 from pathlib import Path
 
 try:
@@ -24,18 +26,11 @@ except ImportError:
     os.system("pip install pyperclip")
     import pyperclip
 
+# Optional: keep-alive HTTP session for validating URLs before queueing
 try:
-    from plyer import notification
-    NOTIFICATIONS_AVAILABLE = True
+    import requests
 except ImportError:
-    print("Installing required package: plyer (for notifications)")
-    os.system("pip install plyer")
-    try:
-        from plyer import notification
-        NOTIFICATIONS_AVAILABLE = True
-    except:
-        NOTIFICATIONS_AVAILABLE = False
-        print("Warning: Notifications not available")
+    requests = None
 
 # Prefer yt-dlp over youtube-dl for better stability and features
 try:
@@ -47,6 +42,35 @@ except ImportError:
         print("Neither yt-dlp nor youtube-dl found. Please install one of them.")
         sys.exit(1)
 
+# oEmbed answers 404 for removed or nonexistent videos without a full extraction
+OEMBED_URL = 'https://www.youtube.com/oembed'
+
+# Characters allowed in a YouTube video id
+VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+
+# Link prefixes handled without the regex, and their canonical URL form
+FAST_URL_PREFIXES = (
+    ('youtu.be/', 'https://youtu.be/'),
+    ('youtube.com/watch?v=', 'https://www.youtube.com/watch?v='),
+)
+
+# Notifications raised within this window are shown as one
+NOTIFICATION_BATCH_WINDOW = 0.5
+
+# Loaded configurations keyed by (path, mtime), reused by later instances
+_CONFIG_CACHE = {}
+
+# Upper bound on remembered video ids (oldest are forgotten first)
+MAX_SEEN_IDS = 10000
+
+
+def _remember_id(ids, video_id):
+    """Add an id to an OrderedDict used as a bounded LRU set."""
+    ids[video_id] = None
+    ids.move_to_end(video_id)
+    while len(ids) > MAX_SEEN_IDS:
+        ids.popitem(last=False)
+
 
 class YouTubeAutoDownloader:
     """Monitors clipboard and automatically downloads YouTube videos."""
@@ -54,28 +78,72 @@ class YouTubeAutoDownloader:
     def __init__(self, config_path="config.json"):
         """Initialize the auto-downloader with configuration."""
         self.config = self.load_config(config_path)
-        self.downloaded_urls = set()
-        self.last_clipboard = ""
+        self._download_path = Path(self.config['download_path']).expanduser().resolve()
+        self._outtmpl = str(self._download_path / self.config['filename_template'])
+        # (length, hash) of the last seen clipboard text
+        self._last_clip_sig = (0, 0)
         self.setup_logging()
         self.ensure_download_directory()
         
-        # Download queue and worker thread
-        self.download_queue = Queue()
-        self.is_downloading = False
-        self.current_download = None
+        # Ids of downloaded videos/playlists, persisted across runs
+        self._seen_ids_file = self._download_path / '.seen_ids.json'
+        self._seen_log_file = self._download_path / '.seen_ids.log'
+        self._downloaded_ids = self._load_seen_ids()
+        self._seen_log = open(self._seen_log_file, 'a', encoding='utf-8', buffering=1)
+        # Guards _downloaded_ids, _seen_ids and the append log
+        self._seen_lock = threading.Lock()
+        # Ids downloaded or currently in queue
+        self._seen_ids = collections.OrderedDict(self._downloaded_ids)
+        
+        # Download queue (deque append/popleft are atomic) and URLs being downloaded
+        self._dq = collections.deque()
+        self._dq_event = threading.Event()
+        self._in_flight = set()
         self.queue_lock = threading.Lock()
+        # Set on shutdown; workers and running downloads stop cooperatively
+        self._stop = threading.Event()
         
-        # Start download worker thread
-        self.worker_thread = threading.Thread(target=self._download_worker, daemon=True)
-        self.worker_thread.start()
+        # plyer notification backend: None until first used, False if unavailable
+        self._notif = None
+        # Notifications waiting to be shown as one batch
+        self._notif_pending = []
+        self._notif_timer = None
+        self._notif_lock = threading.Lock()
         
-        # YouTube URL patterns
-        self.youtube_patterns = [
-            r'(https?://)?(www\.)?(youtube\.com/watch\?v=[\w-]+)',
-            r'(https?://)?(www\.)?(youtu\.be/[\w-]+)',
-            r'(https?://)?(www\.)?(youtube\.com/shorts/[\w-]+)',
-            r'(https?://)?(www\.)?(youtube\.com/playlist\?list=[\w-]+)',
+        # YoutubeDL options are built once; each worker reuses one instance
+        self._ydl_opts = self._build_ydl_opts()
+        self._ydl_local = threading.local()
+        
+        # Start download worker threads; daemon so they never block exit
+        self._workers = [
+            threading.Thread(target=self._download_worker, name=f'ytdl_{i}', daemon=True)
+            for i in range(self.config['max_concurrent'])
         ]
+        for worker in self._workers:
+            worker.start()
+        
+        # Per-worker keep-alive sessions for URL validation
+        self._session_local = threading.local()
+        
+        # Clipboard change notifications (event-driven where supported)
+        self._clipboard_event = threading.Event()
+        self._event_driven = False
+        self._user32 = None
+        self._last_seq = None
+        self._pasteboard = None
+        self._last_change_count = None
+        self._start_clipboard_listener()
+        
+        # YouTube URL patterns, combined into a single alternation
+        self._yt_re = re.compile(
+            r'(?:https?://)?(?:www\.)?(?:'
+            r'youtube\.com/watch\?v=[\w-]+'
+            r'|youtu\.be/[\w-]+'
+            r'|youtube\.com/shorts/[\w-]+'
+            r'|youtube\.com/playlist\?list=[\w-]+'
+            r')',
+            re.IGNORECASE
+        )
         
     def load_config(self, config_path):
         """Load configuration from JSON file."""
@@ -85,21 +153,30 @@ class YouTubeAutoDownloader:
             "enable_notifications": True,
             "check_interval": 1.0,
             "filename_template": "%(title)s-%(id)s.%(ext)s",
-            "merge_output_format": "mp4"
+            "merge_output_format": "mp4",
+            "max_concurrent": 3,
+            "queue_maxsize": 1000
         }
         
         if os.path.exists(config_path):
             try:
+                cache_key = (os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached is not None:
+                    return dict(cached)
+                
                 with open(config_path, 'r', encoding='utf-8') as f:
                     user_config = json.load(f)
                     default_config.update(user_config)
+                _CONFIG_CACHE[cache_key] = dict(default_config)
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
         else:
             # Create default config file
             try:
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_config, f, indent=2)
+                Path(config_path).write_bytes(
+                    json.dumps(default_config, indent=2).encode('utf-8')
+                )
                 print(f"Created default config file: {config_path}")
             except Exception as e:
                 print(f"Could not create config file: {e}")
@@ -108,49 +185,193 @@ class YouTubeAutoDownloader:
     
     def setup_logging(self):
         """Setup logging to file and console."""
-        log_dir = Path(self.config['download_path']) / 'logs'
+        log_dir = self._download_path / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
         
-        log_file = log_dir / f'auto_downloader_{datetime.now().strftime("%Y%m%d")}.log'
+        self.logger = logging.getLogger('yt_auto')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
+        # Handlers are shared by all instances in the process
+        if self.logger.handlers:
+            return
+        
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_dir / 'auto_downloader.log',
+            when='midnight',
+            backupCount=14,
+            encoding='utf-8'
         )
-        self.logger = logging.getLogger(__name__)
+        console_handler = logging.StreamHandler(sys.stdout)
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
     
     def ensure_download_directory(self):
         """Create download directory if it doesn't exist."""
-        download_path = Path(self.config['download_path'])
-        download_path.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Download directory: {download_path}")
+        self._download_path.mkdir(parents=True, exist_ok=True)
+        self.logger.info(f"Download directory: {self._download_path}")
+    
+    def _load_seen_ids(self):
+        """Load ids of videos downloaded in previous runs."""
+        seen_ids = collections.OrderedDict()
+        try:
+            with open(self._seen_ids_file, 'r', encoding='utf-8') as f:
+                for video_id in json.load(f):
+                    _remember_id(seen_ids, video_id)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Could not load downloaded ids: {e}")
+        
+        # Ids appended since the JSON file was last written
+        try:
+            with open(self._seen_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        _remember_id(seen_ids, line.strip())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Could not load downloaded ids log: {e}")
+        
+        return seen_ids
+    
+    def _save_seen_ids(self):
+        """Write all downloaded ids to the JSON file and reset the append log."""
+        with self._seen_lock:
+            try:
+                # Write a temp file and swap it in, so a crash mid-write
+                # cannot leave a truncated history behind
+                tmp_file = self._seen_ids_file.with_name(self._seen_ids_file.name + '.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(list(self._downloaded_ids), f)
+                os.replace(tmp_file, self._seen_ids_file)
+                self._seen_log.seek(0)
+                self._seen_log.truncate()
+            except Exception as e:
+                self.logger.warning(f"Could not save downloaded ids: {e}")
+    
+    def _mark_downloaded(self, video_id):
+        """Remember a downloaded id so it is skipped after a restart."""
+        with self._seen_lock:
+            _remember_id(self._downloaded_ids, video_id)
+            if not self._seen_log.closed:
+                self._seen_log.write(video_id + '\n')
+    
+    def _extract_ids(self, url):
+        """Return (video_id, playlist_id) of a YouTube URL; either may be None."""
+        parsed = urllib.parse.urlparse(url)
+        # The URL regex is case-insensitive, so match query keys the same way
+        query = {
+            key.lower(): value
+            for key, value in urllib.parse.parse_qs(parsed.query).items()
+        }
+        video_id = query.get('v', [None])[0]
+        playlist_id = query.get('list', [None])[0]
+        
+        if video_id is None:
+            path = parsed.path.strip('/').split('/')
+            if parsed.netloc.lower().endswith('youtu.be'):
+                video_id = path[0] or None
+            elif len(path) > 1 and path[0].lower() == 'shorts':
+                video_id = path[1] or None
+        
+        return video_id, playlist_id
+    
+    def _url_id(self, url):
+        """Return the id a queued URL is remembered under."""
+        video_id, playlist_id = self._extract_ids(url)
+        return video_id or playlist_id or url
     
     def is_youtube_url(self, text):
         """Check if text contains a YouTube URL."""
-        if not text or not isinstance(text, str):
+        if not text:
+            return None
+        
+        # Cheap substring prescreen: most clipboard contents are not
+        # YouTube links, so reject them before running the regex.
+        if 'youtu' not in text.lower():
+            return None
+        
+        # Fast path for plain video links
+        for prefix, canonical in FAST_URL_PREFIXES:
+            _, found, rest = text.partition(prefix)
+            if not found:
+                continue
+            video_id = rest[:11]
+            if (len(video_id) == 11 and VIDEO_ID_CHARS.issuperset(video_id)
+                    and rest[11:12] not in VIDEO_ID_CHARS):
+                return canonical + video_id
+        
+        # Shorts, playlists and unusual spellings
+        match = self._yt_re.search(text)
+        if not match:
             return None
         
-        for pattern in self.youtube_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Extract full URL
-                url = match.group(0)
-                if not url.startswith('http'):
-                    url = 'https://' + url
-                return url
-        return None
+        # Extract full URL
+        url = match.group(0)
+        if not url.lower().startswith('http'):
+            url = 'https://' + url
+        return url
     
     def show_notification(self, title, message, timeout=5):
-        """Show system notification."""
-        if not self.config['enable_notifications'] or not NOTIFICATIONS_AVAILABLE:
+        """Show system notification, batched with others raised shortly after."""
+        if not self.config['enable_notifications']:
+            return
+        
+        # plyer loads its platform backend on import, so defer it to first use
+        if self._notif is None:
+            try:
+                from plyer import notification
+                self._notif = notification
+            except ImportError:
+                self.logger.warning("Notifications not available, install plyer to enable them")
+                self._notif = False
+        if self._notif is False:
+            return
+        
+        with self._notif_lock:
+            self._notif_pending.append((title, message, timeout))
+            if self._notif_timer is None:
+                self._notif_timer = threading.Timer(
+                    NOTIFICATION_BATCH_WINDOW, self._flush_notifications
+                )
+                self._notif_timer.daemon = True
+                self._notif_timer.start()
+    
+    def _flush_notifications(self):
+        """Show all pending notifications as a single one."""
+        with self._notif_lock:
+            pending, self._notif_pending = self._notif_pending, []
+            if self._notif_timer is not None:
+                self._notif_timer.cancel()
+                self._notif_timer = None
+        
+        if not pending:
             return
         
+        title, message, timeout = pending[-1]
+        if len(pending) > 1:
+            counts = collections.Counter(t for t, _, _ in pending)
+            if len(counts) == 1:
+                # Same kind of event repeated: count it, keep the latest details
+                title = f"{title} (x{len(pending)})"
+            else:
+                # One line per kind of event, with its latest details
+                latest = {t: m for t, m, _ in pending}
+                lines = []
+                for t, n in counts.items():
+                    label = f"{t} (x{n})" if n > 1 else t
+                    details = latest[t].replace("\n", " - ")
+                    lines.append(f"{label}: {details}")
+                title = 'YouTube Auto-Downloader'
+                message = "\n".join(lines)
+            timeout = max(t for _, _, t in pending)
+        
         try:
-            notification.notify(
+            self._notif.notify(
                 title=title,
                 message=message,
                 app_name='YouTube Auto-Downloader',
@@ -159,71 +380,144 @@ class YouTubeAutoDownloader:
         except Exception as e:
             self.logger.warning(f"Could not show notification: {e}")
     
+    def _get_session(self):
+        """Return this worker thread's HTTP session, or None without requests."""
+        if requests is None:
+            return None
+        session = getattr(self._session_local, 'session', None)
+        if session is None:
+            session = self._session_local.session = requests.Session()
+        return session
+    
+    def _validate_url(self, url):
+        """Return False if YouTube reports the video as gone."""
+        video_id, _ = self._extract_ids(url)
+        session = self._get_session()
+        # Playlists are left to the extractor
+        if session is None or video_id is None:
+            return True
+        
+        try:
+            response = session.get(
+                OEMBED_URL,
+                params={'url': url, 'format': 'json'},
+                timeout=3
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not validate URL {url}: {e}")
+            return True
+        
+        if response.status_code in (404, 410):
+            self.logger.warning(f"Video unavailable, skipped: {url}")
+            # Forget it so a later copy is checked again
+            with self._seen_lock:
+                self._seen_ids.pop(video_id, None)
+            self.show_notification(
+                "Video Unavailable ✗",
+                f"Skipped: {url[:50]}"
+            )
+            return False
+        return True
+    
     def add_to_queue(self, url):
         """Add URL to download queue."""
-        if url in self.downloaded_urls:
+        video_id, playlist_id = self._extract_ids(url)
+        if video_id is None and playlist_id is None:
+            self.logger.warning(f"No video or playlist id in URL: {url}")
+            return
+        
+        # A link to a video inside a playlist downloads just that video
+        if video_id:
+            playlist_id = None
+        
+        seen_id = video_id or playlist_id
+        with self._seen_lock:
+            is_duplicate = seen_id in self._seen_ids
+            if is_duplicate:
+                self._seen_ids.move_to_end(seen_id)
+        if is_duplicate:
             self.logger.info(f"URL already downloaded or in queue: {url}")
             return
         
-        # Add to downloaded_urls to prevent duplicates in queue
-        self.downloaded_urls.add(url)
+        # Queue a normalized URL so equivalent links look the same
+        if video_id:
+            url = f"https://www.youtube.com/watch?v={video_id}"
+        else:
+            url = f"https://www.youtube.com/playlist?list={playlist_id}"
+        
+        # Apply backpressure instead of growing the queue without bound
+        if len(self._dq) >= self.config['queue_maxsize']:
+            self.logger.warning(f"Queue full, dropped URL: {url}")
+            self.show_notification(
+                "Queue Full",
+                f"Dropped URL, {len(self._dq)} video(s) already waiting"
+            )
+            return
+        
+        # Add to seen ids to prevent duplicates in queue
+        with self._seen_lock:
+            _remember_id(self._seen_ids, seen_id)
         
         # Add to queue
-        self.download_queue.put(url)
-        queue_size = self.download_queue.qsize()
+        self._dq.append(url)
+        self._dq_event.set()
+        queue_size = len(self._dq) + len(self._in_flight)
         
-        if queue_size == 1 and not self.is_downloading:
+        max_concurrent = self.config['max_concurrent']
+        if queue_size <= max_concurrent:
             self.logger.info(f"Added to queue: {url}")
             self.show_notification(
                 "Added to Queue",
-                f"Download will start shortly...\nQueue: {queue_size} video(s)"
+                f"Download will start shortly...\nDownloading: {queue_size} video(s)"
             )
         else:
-            self.logger.info(f"Added to queue (position {queue_size}): {url}")
+            queue_position = queue_size - max_concurrent
+            self.logger.info(f"Added to queue (position {queue_position}): {url}")
             self.show_notification(
                 "Added to Queue",
-                f"Position in queue: {queue_size}\nCurrent: {self.current_download or 'Starting...'}"
+                f"Position in queue: {queue_position}\nDownloading: {max_concurrent} video(s)"
             )
     
     def _download_worker(self):
         """Worker thread that processes download queue."""
-        while True:
+        try:
+            self._process_queue()
+        finally:
+            self._close_ydl()
+    
+    def _process_queue(self):
+        """Download queued URLs until shutdown is requested."""
+        while not self._stop.is_set():
             try:
-                # Get URL from queue (blocking)
-                url = self.download_queue.get()
-                
-                if url is None:  # Poison pill to stop worker
-                    break
-                
-                # Download the video
-                self._download_video(url)
-                
-                # Mark task as done
-                self.download_queue.task_done()
-                
+                url = self._dq.popleft()
+            except IndexError:
+                # Clear before re-checking so an append between the two
+                # always leaves the event set
+                self._dq_event.clear()
+                if not self._dq:
+                    self._dq_event.wait(timeout=0.5)
+                continue
+            
+            # In flight from here on, so queue positions and shutdown count
+            # the URL while it is validated as well as while it downloads
+            with self.queue_lock:
+                self._in_flight.add(url)
+            try:
+                # Checked here rather than in add_to_queue so the network
+                # round trip never stalls the clipboard monitor
+                if self._validate_url(url):
+                    self._download_video(url)
             except Exception as e:
                 self.logger.error(f"Error in download worker: {e}")
+            finally:
+                with self.queue_lock:
+                    self._in_flight.discard(url)
     
-    def _download_video(self, url):
-        """Actually download video using youtube-dl."""
-        with self.queue_lock:
-            self.is_downloading = True
-            self.current_download = url[:50] + "..."
-        
-        queue_remaining = self.download_queue.qsize()
-        
-        self.logger.info(f"Starting download: {url}")
-        self.show_notification(
-            "Download Started",
-            f"Downloading...\nRemaining in queue: {queue_remaining}"
-        )
-        
-        ydl_opts = {
+    def _build_ydl_opts(self):
+        """Build youtube-dl options from configuration."""
+        return {
             'format': self.config['video_format'],
-            'outtmpl': os.path.join(
-                self.config['download_path'],
-                self.config['filename_template']
-            ),
+            'outtmpl': self._outtmpl,
             'merge_output_format': self.config['merge_output_format'],
             'quiet': False,
             'no_warnings': False,
@@ -233,50 +527,209 @@ class YouTubeAutoDownloader:
             'fragment_retries': 10,
             'continuedl': True,
             'nocheckcertificate': True,
-            'postprocessors': [{
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': 'mp4',
-            }],
+            'progress_hooks': [self._check_stop],
         }
+    
+    def _check_stop(self, status):
+        """Progress hook aborting the download once shutdown is requested."""
+        if self._stop.is_set():
+            raise KeyboardInterrupt
+    
+    def _get_ydl(self):
+        """Return this worker thread's YoutubeDL instance, creating it once."""
+        ydl = getattr(self._ydl_local, 'ydl', None)
+        if ydl is None:
+            # A YoutubeDL instance is not thread-safe, so each worker gets its own
+            ydl = youtube_dl.YoutubeDL(self._ydl_opts)
+            ydl.__enter__()
+            self._ydl_local.ydl = ydl
+        return ydl
+    
+    def _close_ydl(self):
+        """Close this worker thread's YoutubeDL instance, if any."""
+        ydl = getattr(self._ydl_local, 'ydl', None)
+        if ydl is not None:
+            self._ydl_local.ydl = None
+            ydl.__exit__(None, None, None)
+    
+    def _download_video(self, url):
+        """Actually download video using youtube-dl."""
+        queue_remaining = len(self._dq)
+        self.logger.info(f"Starting download: {url}")
+        self.show_notification(
+            "Download Started",
+            f"Downloading...\nRemaining in queue: {queue_remaining}"
+        )
         
+        video_title = None
+        error_msg = None
         try:
-            with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                video_title = info.get('title', 'Unknown')
-                
+            info = self._get_ydl().extract_info(url, download=True)
+            video_title = info.get('title', 'Unknown')
+        except KeyboardInterrupt:
+            # Raised by _check_stop; the partial file is resumed next time
+            self.logger.info(f"Download stopped: {url}")
+        except Exception as e:
+            error_msg = str(e)
+        
+        if video_title is not None:
             self.logger.info(f"Successfully downloaded: {video_title}")
+            self._mark_downloaded(self._url_id(url))
             
-            queue_remaining = self.download_queue.qsize()
+            queue_remaining = len(self._dq)
             if queue_remaining > 0:
-                self.show_notification(
-                    "Download Complete! ✓",
-                    f"{video_title[:50]}\nNext in queue: {queue_remaining} video(s)",
-                    timeout=10
-                )
+                message = f"{video_title[:50]}\nNext in queue: {queue_remaining} video(s)"
             else:
-                self.show_notification(
-                    "Download Complete! ✓",
-                    f"{video_title[:50]}\nQueue is empty",
-                    timeout=10
-                )
-            
-        except Exception as e:
-            error_msg = str(e)
+                message = f"{video_title[:50]}\nQueue is empty"
+            self.show_notification("Download Complete! ✓", message, timeout=10)
+        
+        elif error_msg is not None:
             self.logger.error(f"Download failed: {error_msg}")
+            # Allow the URL to be retried when copied again
+            with self._seen_lock:
+                self._seen_ids.pop(self._url_id(url), None)
             self.show_notification(
                 "Download Failed ✗",
                 f"Error: {error_msg[:100]}",
                 timeout=10
             )
-        finally:
-            with self.queue_lock:
-                self.is_downloading = False
-                self.current_download = None
+    
+    def _start_clipboard_listener(self):
+        """Start a platform clipboard change listener, if available."""
+        if sys.platform == 'win32':
+            import ctypes
+            # Sequence number changes on every clipboard update; reading it
+            # is much cheaper than fetching the clipboard text
+            self._user32 = ctypes.windll.user32
+            listener = threading.Thread(target=self._win32_clipboard_listener, daemon=True)
+            listener.start()
+        elif sys.platform == 'darwin':
+            # Optional: cheap clipboard change counter; AppKit is slow to load,
+            # so only import it on macOS
+            try:
+                from AppKit import NSPasteboard
+            except ImportError:
+                return
+            self._pasteboard = NSPasteboard.generalPasteboard()
+    
+    def _win32_clipboard_listener(self):
+        """Pump WM_CLIPBOARDUPDATE messages on a hidden message-only window."""
+        import ctypes
+        from ctypes import wintypes
+        
+        WM_CLIPBOARDUPDATE = 0x031D
+        HWND_MESSAGE = wintypes.HWND(-3)
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(
+            LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+        )
+        
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [
+                ('style', wintypes.UINT),
+                ('lpfnWndProc', WNDPROC),
+                ('cbClsExtra', ctypes.c_int),
+                ('cbWndExtra', ctypes.c_int),
+                ('hInstance', wintypes.HINSTANCE),
+                ('hIcon', wintypes.HICON),
+                ('hCursor', wintypes.HANDLE),
+                ('hbrBackground', wintypes.HBRUSH),
+                ('lpszMenuName', wintypes.LPCWSTR),
+                ('lpszClassName', wintypes.LPCWSTR),
+            ]
+        
+        try:
+            user32 = ctypes.windll.user32
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+            user32.DefWindowProcW.argtypes = [
+                wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+            ]
+            user32.DefWindowProcW.restype = LRESULT
+            user32.CreateWindowExW.argtypes = [
+                wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID
+            ]
+            user32.CreateWindowExW.restype = wintypes.HWND
+            
+            def wnd_proc(hwnd, msg, wparam, lparam):
+                if msg == WM_CLIPBOARDUPDATE:
+                    self._clipboard_event.set()
+                    return 0
+                return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+            
+            # Keep a reference to the callback for the lifetime of the window
+            self._wnd_proc = WNDPROC(wnd_proc)
+            
+            window_class = WNDCLASSW()
+            window_class.lpfnWndProc = self._wnd_proc
+            window_class.hInstance = kernel32.GetModuleHandleW(None)
+            window_class.lpszClassName = 'YouTubeAutoDownloaderClipboard'
+            if not user32.RegisterClassW(ctypes.byref(window_class)):
+                raise ctypes.WinError()
+            
+            hwnd = user32.CreateWindowExW(
+                0, window_class.lpszClassName, 'YouTube Auto-Downloader', 0,
+                0, 0, 0, 0, HWND_MESSAGE, None, window_class.hInstance, None
+            )
+            if not hwnd or not user32.AddClipboardFormatListener(hwnd):
+                raise ctypes.WinError()
+        except Exception as e:
+            self.logger.warning(f"Clipboard listener not available, polling instead: {e}")
+            return
+        
+        self._event_driven = True
+        # Force an initial clipboard read
+        self._clipboard_event.set()
+        
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+    
+    def _get_clipboard_changed(self):
+        """Return True if the clipboard may have changed since the last check."""
+        if self._event_driven:
+            if not self._clipboard_event.is_set():
+                return False
+            self._clipboard_event.clear()
+        
+        if self._user32 is not None:
+            seq = self._user32.GetClipboardSequenceNumber()
+            if seq == self._last_seq:
+                return False
+            self._last_seq = seq
+            return True
+        
+        if self._pasteboard is not None:
+            change_count = self._pasteboard.changeCount()
+            if change_count == self._last_change_count:
+                return False
+            self._last_change_count = change_count
+            return True
+        
+        # No change notifications available, read the clipboard every tick
+        return True
+    
+    def _wait_for_clipboard(self, timeout, max_slice):
+        """Wait up to timeout seconds, returning early on a clipboard change.
+        
+        Waits in slices of at most max_slice seconds: on Windows, Ctrl+C
+        only interrupts an Event.wait once it times out.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self._clipboard_event.wait(timeout=min(remaining, max_slice)):
+                return
     
     def monitor_clipboard(self):
         """Monitor clipboard for YouTube URLs."""
         self.logger.info("Starting clipboard monitor...")
-        self.logger.info(f"Download path: {self.config['download_path']}")
+        self.logger.info(f"Download path: {self._download_path}")
         self.logger.info(f"Video format: {self.config['video_format']}")
         self.logger.info("Waiting for YouTube URLs in clipboard...")
         
@@ -285,21 +738,35 @@ class YouTubeAutoDownloader:
             "Monitoring clipboard for YouTube links"
         )
         
+        # Back off while the clipboard stays unchanged
+        base_interval = self.config['check_interval']
+        max_interval = base_interval * 30
+        interval = base_interval
+        
         try:
             while True:
                 try:
-                    clipboard_content = pyperclip.paste()
-                    
-                    # Check if clipboard changed and contains YouTube URL
-                    if clipboard_content != self.last_clipboard:
-                        self.last_clipboard = clipboard_content
+                    changed = False
+                    if self._get_clipboard_changed():
+                        clipboard_content = pyperclip.paste()
                         
-                        youtube_url = self.is_youtube_url(clipboard_content)
-                        if youtube_url:
-                            self.logger.info(f"YouTube URL detected: {youtube_url}")
-                            self.add_to_queue(youtube_url)
+                        # Check if clipboard changed and contains YouTube URL
+                        clip_sig = (len(clipboard_content), hash(clipboard_content))
+                        if clip_sig != self._last_clip_sig:
+                            self._last_clip_sig = clip_sig
+                            changed = True
+                            
+                            youtube_url = self.is_youtube_url(clipboard_content)
+                            if youtube_url:
+                                self.logger.info(f"YouTube URL detected: {youtube_url}")
+                                self.add_to_queue(youtube_url)
                     
-                    time.sleep(self.config['check_interval'])
+                    if changed:
+                        interval = base_interval
+                    else:
+                        interval = min(interval * 1.5, max_interval)
+                    
+                    self._wait_for_clipboard(interval, base_interval)
                     
                 except KeyboardInterrupt:
                     raise
@@ -313,22 +780,54 @@ class YouTubeAutoDownloader:
                 "Auto-Downloader Stopped",
                 "Clipboard monitoring stopped"
             )
+            self.shutdown()
+    
+    def shutdown(self):
+        """Stop download workers and persist state before exiting."""
+        # Safe to call more than once
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._dq_event.set()
+        
+        with self.queue_lock:
+            active = len(self._in_flight)
+        if active:
+            self.logger.info(f"Stopping {active} active download(s)...")
+        
+        deadline = time.monotonic() + 30
+        for worker in self._workers:
+            worker.join(timeout=max(0, deadline - time.monotonic()))
+        still_running = sum(worker.is_alive() for worker in self._workers)
+        if still_running:
+            self.logger.warning(
+                f"{still_running} download worker(s) did not stop in time, exiting anyway"
+            )
+        self._save_seen_ids()
+        with self._seen_lock:
+            self._seen_log.close()
+        # Show anything still pending instead of waiting for the timer
+        self._flush_notifications()
     
     def run(self):
         """Start the auto-downloader."""
         print("\n" + "="*60)
         print("YouTube Auto-Downloader with Queue System")
         print("="*60)
-        print(f"Download folder: {self.config['download_path']}")
+        print(f"Download folder: {self._download_path}")
         print(f"Video format: {self.config['video_format']}")
         print(f"Notifications: {'Enabled' if self.config['enable_notifications'] else 'Disabled'}")
-        print(f"Queue mode: Sequential (one at a time)")
+        print(f"Queue mode: Parallel (up to {self.config['max_concurrent']} at a time)")
         print("\nCopy any YouTube URL to add it to the download queue!")
-        print("Videos will download one after another.")
+        print(f"Up to {self.config['max_concurrent']} videos download at the same time.")
         print("Press Ctrl+C to stop\n")
         print("="*60 + "\n")
         
-        self.monitor_clipboard()
+        try:
+            self.monitor_clipboard()
+        finally:
+            # Also covers Ctrl+C outside the monitor loop
+            self.shutdown()
 
 
 def main():